@@ -5,7 +5,7 @@ Classes:
     data
 """
 
-from typing import List
+from typing import ClassVar, Tuple
 from app.sun_times import SunTimes
 from .calculate_temp_utils.get_user_time_interval import TimeIntervalCalculator
 
@@ -22,6 +22,20 @@ class CalculateTemp:
     Single responsibility: Calculate temperature using sun times data and verify SunTimes objects.
     """
 
+    # Calculators keep no state, so single instances are reused across calls.
+    _INTERVAL_CALCULATOR: ClassVar[TimeIntervalCalculator] = TimeIntervalCalculator()
+
+    # Attributes a SunTimes object must have, checked by verify_sun_times.
+    _REQUIRED_ATTRIBUTES: ClassVar[Tuple[str, ...]] = (
+        "sunrise",
+        "sunset",
+        "morning_twilight",
+        "night_twilight",
+        "midday_period_begins",
+        "midday_period_ends",
+        "user_time",
+    )
+
     @staticmethod
     def calculate_temp(sun_times: SunTimes) -> int:
         """
@@ -36,8 +50,7 @@ class CalculateTemp:
         Single Responsibility: Use the `GetTemp` utility to calculate the temperature from sun times
         data.
         """
-        temp_calculator: TimeIntervalCalculator = TimeIntervalCalculator()
-        return temp_calculator.get_interval(sun_times)
+        return CalculateTemp._INTERVAL_CALCULATOR.get_interval(sun_times)
 
     @staticmethod
     def verify_sun_times(sun_times: SunTimes) -> bool:
@@ -52,17 +65,7 @@ class CalculateTemp:
 
         Single Responsibility: Verify the completeness of a SunTimes object.
         """
-        required_attributes: List[str] = [
-            "sunrise",
-            "sunset",
-            "morning_twilight",
-            "night_twilight",
-            "midday_period_begins",
-            "midday_period_ends",
-            "user_time",
-        ]
-
-        for attr in required_attributes:
+        for attr in CalculateTemp._REQUIRED_ATTRIBUTES:
             if not hasattr(sun_times, attr):
                 return False
         return True
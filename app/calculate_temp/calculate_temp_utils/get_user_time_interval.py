@@ -18,12 +18,14 @@ Usage:
 
 Dependencies:
     - abc: Provides the abstract base class functionality.
+    - typing: Provides type hinting for better code readability and maintenance.
     - app.sun_times: Contains the `SunTimes` class used to structure the parsed time data.
     - .proportion_calculator: Gives `ProportionCalculator` class for calculating user proportions.
     - .get_temp: Provides the `GetTemp` class for temperature calculations based on time intervals.
 """
 
 from abc import ABC, abstractmethod
+from typing import ClassVar
 from app.sun_times import SunTimes
 from .proportion_calculator import ProportionCalculator
 from .get_temp import GetTemp
@@ -80,12 +82,14 @@ class TimeIntervalCalculator(AbstractTimeIntervalCalculator):
     Single responsibility: Calculate time intervals based on user time and sun times data.
     """
 
+    _PROPORTION_CALCULATOR: ClassVar[ProportionCalculator] = ProportionCalculator()
+
     @staticmethod
     def instantiate_proportion(sun_times: SunTimes) -> float:
         """
         See base class `AbstractTimeIntervalCalculator` for full method documentation.
         """
-        prop_calculator = ProportionCalculator()
+        prop_calculator = TimeIntervalCalculator._PROPORTION_CALCULATOR
         morning_prop: float = prop_calculator.get_user_prop_morning(sun_times)
         night_prop: float = prop_calculator.get_user_prop_night(sun_times)
         return morning_prop, night_prop
@@ -95,26 +99,24 @@ class TimeIntervalCalculator(AbstractTimeIntervalCalculator):
         See base class `AbstractTimeIntervalCalculator` for full method documentation.
         """
 
+        user_time = sun_times.user_time
+        if sun_times.midday_period_begins < user_time < sun_times.midday_period_ends:
+            return GetTemp.user_in_midday_period()
+
+        in_morning_twilight = (
+            sun_times.morning_twilight <= user_time <= sun_times.midday_period_begins
+        )
+        in_night_twilight = (
+            sun_times.midday_period_ends <= user_time <= sun_times.night_twilight
+        )
+        if not (in_morning_twilight or in_night_twilight):
+            return GetTemp.user_in_night_period()
+
+        # Proportions are only needed, and only computed, when the user is in a twilight period
         morning_prop: float
         night_prop: float
         morning_prop, night_prop = self.instantiate_proportion(sun_times)
-        if (
-            sun_times.midday_period_begins
-            < sun_times.user_time
-            < sun_times.midday_period_ends
-        ):
-            return GetTemp.user_in_midday_period()
-        if (
-            sun_times.morning_twilight
-            <= sun_times.user_time
-            <= sun_times.midday_period_begins
-        ):
+        if in_morning_twilight:
             return GetTemp.user_in_morning_twilight(morning_prop)
-        if (
-            sun_times.midday_period_ends
-            <= sun_times.user_time
-            <= sun_times.night_twilight
-        ):
-            return GetTemp.user_in_night_twilight(night_prop)
-
-        return GetTemp.user_in_night_period()
+
+        return GetTemp.user_in_night_twilight(night_prop)
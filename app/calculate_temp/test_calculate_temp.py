@@ -5,13 +5,8 @@ The CalculateTemp class is responsible for calculating the temperature based on
 time.
 
 Tests:
-    - test_midday_period: Tests that the temperature is correctly calculated during the midday
-      period.
-    - test_night_period: Tests that the temperature is correctly calculated during the night period.   
-    - test_morning_twilight_period: Tests that the temperature is correctly calculated during the
-      morning twilight period.
-    - test_night_twilight_period: Tests that the temperature is correctly calculated during the 
-      night twilight period."""
+    - test_calculate_temp: Tests that the temperature is correctly calculated, as one sub-test per
+      case, during the midday, night, morning twilight, and night twilight periods."""
 
 import unittest
 from datetime import datetime
@@ -20,6 +15,24 @@ from app.sun_times import SunTimes
 from app.calculate_temp.calculate_temp import CalculateTemp
 
 
+def on_test_day(hour: int, minute: int) -> datetime:
+    """
+    Build a datetime at the given time on the test day, 2024-01-01.
+    """
+    return datetime(2024, 1, 1, hour, minute)
+
+
+# Sun times for the test day; datetimes are immutable, so every test shares these instances.
+SUN_TIMES = {
+    "sunrise": on_test_day(6, 0),
+    "sunset": on_test_day(18, 0),
+    "morning_twilight": on_test_day(5, 30),
+    "night_twilight": on_test_day(18, 30),
+    "midday_period_begins": on_test_day(6, 30),
+    "midday_period_ends": on_test_day(17, 30),
+}
+
+
 class TestCalculateTemp(unittest.TestCase):
     """
     Unit tests for the calculate_temp method.
@@ -28,92 +41,60 @@ class TestCalculateTemp(unittest.TestCase):
     temperature based on the user's input time and the sun times data.
 
     Methods:
-        - setUp: Creates a SunTimes object with real values.
-        - test_midday_period: Tests that the temperature is correctly calculated during the midday
-          period.
-        - test_night_period: Tests that the temperature is correctly calculated during the night
-          period.
-        - test_morning_twilight_period: Tests that the temperature is correctly calculated during
-          the morning twilight period.
-        - test_night_twilight_period: Tests that the temperature is correctly calculated during the
-          night twilight period.
+        - setUpClass: Initializes the Flask application once for all tests.
+        - setUp: Pushes the application context and creates a SunTimes object with real values.
+        - test_calculate_temp: Tests that the temperature is correctly calculated for every period
+          in `CASES`.
     """
 
+    # (period name, user time, expected temperature as a fraction of the way from LO_TEMP to
+    # HI_TEMP)
+    CASES = (
+        ("midday_period", on_test_day(16, 0), 1),
+        ("night_period", on_test_day(3, 30), 0),
+        ("morning_twilight_period", on_test_day(5, 45), 1 / 4),
+        ("night_twilight_period", on_test_day(17, 45), 3 / 4),
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up the Flask application once for the whole test case, since every test uses the same
+        configuration.
+        """
+        cls.app = Flask(__name__)
+        cls.app.config.from_pyfile("../../config.py")
+
     def setUp(self):
         """
         Set up the test case with a SunTimes object containing real values. This object will be used
         in the test methods to verify that the calculate_temp method correctly calculates the
         temperature based on the user's input time and the sun times data.
         """
-        # Create a SunTimes object with real values
-        self.app = Flask(__name__)
-        self.app.config.from_pyfile("../../config.py")
         self.app_context = self.app.app_context()
         self.app_context.push()
-        self.sun_times = SunTimes()
-        self.sun_times.sunrise = datetime(2024, 1, 1, 6, 0)
-        self.sun_times.sunset = datetime(2024, 1, 1, 18, 0)
-        self.sun_times.morning_twilight = datetime(2024, 1, 1, 5, 30)
-        self.sun_times.night_twilight = datetime(2024, 1, 1, 18, 30)
-        self.sun_times.midday_period_begins = datetime(2024, 1, 1, 6, 30)
-        self.sun_times.midday_period_ends = datetime(2024, 1, 1, 17, 30)
-
-    def test_midday_period(self):
-        """
-        Test that the temperature is correctly calculated during the midday period.
-        """
-        # Call the method under test using the actual TimeIntervalCalculator
-        self.sun_times.user_time = datetime(2024, 1, 1, 16, 0)
+        self.addCleanup(self.app_context.pop)
 
-        calculated_temp = CalculateTemp.calculate_temp(self.sun_times)
-
-        # Assert that the temperature is correctly calculated
-        self.assertEqual(
-            calculated_temp, 6000
-        )  # Adjust expected value based on real logic
+        # Create a SunTimes object with real values
+        self.sun_times = SunTimes(**SUN_TIMES)
 
-    def test_night_period(self):
+    def test_calculate_temp(self):
         """
-        Test that the temperature is correctly calculated during the night period.
+        Test that the temperature is correctly calculated for each period in `CASES`.
         """
-        self.sun_times.user_time = datetime(2024, 1, 1, 3, 30)
+        lo_temp = self.app.config["LO_TEMP"]
+        hi_temp = self.app.config["HI_TEMP"]
 
-        calculated_temp = CalculateTemp.calculate_temp(self.sun_times)
+        for period, user_time, fraction in self.CASES:
+            with self.subTest(period=period):
+                self.sun_times.user_time = user_time
 
-        # Assert that the temperature is correctly calculated
-        self.assertEqual(
-            calculated_temp, 2700
-        )  # Adjust expected value based on real logic
+                calculated_temp = CalculateTemp.calculate_temp(self.sun_times)
 
-    def test_morning_twilight_period(self):
-        """
-        Test that the temperature is correctly calculated during the morning twilight period.
-        """
-        self.sun_times.user_time = datetime(2024, 1, 1, 5, 45)
-
-        calculated_temp = CalculateTemp.calculate_temp(self.sun_times)
-        expected_temp = self.app.config["LO_TEMP"] + (
-            self.app.config["HI_TEMP"] - self.app.config["LO_TEMP"]
-        ) * (1 / 4)
-        # Assert that the temperature is correctly calculated
-        self.assertEqual(
-            calculated_temp, expected_temp
-        )  # Adjust expected value based on real logic
-
-    def test_night_twilight_period(self):
-        """
-        Test that the temperature is correctly calculated during the night twilight period.
-        """
-        self.sun_times.user_time = datetime(2024, 1, 1, 17, 45)
-
-        calculated_temp = CalculateTemp.calculate_temp(self.sun_times)
-        expected_temp = self.app.config["HI_TEMP"] - (
-            self.app.config["HI_TEMP"] - self.app.config["LO_TEMP"]
-        ) * (1 / 4)
-        # Assert that the temperature is correctly calculated
-        self.assertEqual(
-            calculated_temp, expected_temp
-        )  # Adjust expected value based on real logic
+                # Assert that the temperature is correctly calculated
+                self.assertEqual(
+                    calculated_temp, lo_temp + (hi_temp - lo_temp) * fraction
+                )
 
 
 if __name__ == "__main__":
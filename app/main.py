@@ -7,6 +7,8 @@ and calculating the temperature based on the processed data.
 Functions:
     - main: Fetches sun times data based on latitude and longitude, processes the API response, 
       and calculates the temperature.
+    - main_batch: Does the same as `main` for a batch of locations, calculating one temperature per
+      location.
 
 Dependencies:
     - flask: Used for creating JSON responses.
@@ -21,6 +23,7 @@ Dependencies:
 from flask import jsonify, Response
 from app.sun_times import SunTimes
 from .process_response.process_response import ProcessAPICall
+from .process_response.process_response_utils.sun_times_api import SunTimesAPI
 from .calculate_temp.calculate_temp import CalculateTemp
 
 
@@ -39,3 +42,27 @@ def main() -> Response:
     api_processor: ProcessAPICall = ProcessAPICall()
     processed_api_response: SunTimes = api_processor.process_api_call()
     return jsonify(temperature=CalculateTemp.calculate_temp(processed_api_response))
+
+
+def main_batch() -> Response:
+    """
+    Batch function to handle one user request for many locations end to end, and returning the
+    response.
+
+    Process:
+        1. Reads the requested locations using `SunTimesAPI`.
+        2. Fetches and processes sun times data for every location using `ProcessAPICall`.
+        3. Calculates the temperature of each location using `CalculateTemp`.
+
+    Single Responsibility: Handles one batch user request end to end.
+    """
+
+    coordinates = SunTimesAPI.get_batch_args()
+    api_processor: ProcessAPICall = ProcessAPICall()
+    processed_api_responses = api_processor.process_api_call_batch(coordinates)
+    return jsonify(
+        [
+            {"temperature": CalculateTemp.calculate_temp(sun_times)}
+            for sun_times in processed_api_responses
+        ]
+    )
@@ -12,9 +12,10 @@ Usage:
     `SunTimes` object containing the processed sun times data.
 
 Dependencies:
-    - app.sun_times: Contains `SunTimes` class used to structure the parsed and processed time data.
+    - app.sun_times: Contains `SunTimes` class used to structure the parsed and processed time data,
+       and `process_sun_times`/`process_sun_times_batch` for building it from parsed API responses.
     - .process_response_utils.response_handler: Contains the `ResponseHandler` class for handling 
-       API responses.
+       API responses, and the `API_TIME_KEYS` the response must contain.
     - .process_response_utils.midday_calculator: Contains the `MiddayPeriodCalculator` class for 
        calculating midday periods.
     - .process_response_utils.date_adjustment: Contains `DateAdjustment` class for adjusting dates.
@@ -22,9 +23,10 @@ Dependencies:
        data from an API.
 """
 
-from app.sun_times import SunTimes
+from typing import Any, Dict, List, Tuple
+from app.sun_times import SunTimes, process_sun_times, process_sun_times_batch
 from app.process_response.process_response_utils.sun_times_api import SunTimesAPI
-from .process_response_utils.response_handler import ResponseHandler
+from .process_response_utils.response_handler import API_TIME_KEYS, ResponseHandler
 from .process_response_utils.midday_calculator import MiddayPeriodCalculator
 from .process_response_utils.date_adjustment import DateAdjustment
 
@@ -45,7 +47,6 @@ class ProcessAPICall:
         Initializes the necessary components for processing API calls.
         """
         self.response_handler = ResponseHandler()
-        self.sun_times_builder = SunTimes()
         self.midday_calculator = MiddayPeriodCalculator()
         self.date_adjustment = DateAdjustment()
 
@@ -54,55 +55,115 @@ class ProcessAPICall:
         Validates the API response to ensure it contains the expected data.
 
         Args:
-            response (dict): The API response containing sun times data.
+            response (dict): The "results" object of the API response containing sun times data.
 
         Returns:
             bool: True if the response is valid, False otherwise.
 
         Single Responsibility: Validate the API response format and content.
         """
-        required_keys = [
-            "sunrise",
-            "sunset",
-            "civil_twilight_begin",
-            "civil_twilight_end",
-        ]
-        for key in required_keys:
-            if key not in response.json()["results"]:
+        for key in API_TIME_KEYS:
+            if key not in response:
                 raise RuntimeError(f"Invalid API response format: '{key}' key missing")
 
-    def process_api_call(self) -> SunTimes:
+    def format_response(self, response: Dict[str, str]) -> Dict[str, Any]:
         """
-        Processes an API call to fetch and process sun times data.
+        Validates one API response and parses its sun times.
 
         Args:
-            response (dict): The API response containing sun times data.
+            response (Dict[str, str]): The "results" object of the API response.
 
         Returns:
-            SunTimes: A structured object containing the processed sun times data.
+            Dict[str, Any]: The parsed sun times, keyed by sun phase.
 
-        Process:
-            1. Handles the API response using `ResponseHandler`.
-            2. Processes the raw sun times data using `SunTimes`.
-            3. Adjusts the dates using `DateAdjustment`.
-            4. Calculates the midday period using `MiddayPeriodCalculator`.
+        Single Responsibility: Turn one API response into parsed sun times.
+        """
+        self.validate_response(response)
+        return self.response_handler.handle_response(response)
 
-        Single Responsibility: Manage the entire process of fetching and processing sun times data.
+    def adjust_sun_times(self, sun_times: SunTimes) -> SunTimes:
         """
+        Adjusts the dates of a SunTimes object and calculates its midday period.
 
-        response = SunTimesAPI.fetch_sun_times()
-        self.validate_response(response)
+        Args:
+            sun_times (SunTimes): A SunTimes object combined with the user's date.
 
-        formatted_response = self.response_handler.handle_response(response)
-        raw_sun_times_object = self.sun_times_builder.process_sun_times(
-            formatted_response
-        )
-        date_adjusted_sun_times_object = self.date_adjustment.adjust_dates(
-            raw_sun_times_object
-        )
+        Returns:
+            SunTimes: A structured object containing the processed sun times data.
+
+        Single Responsibility: Finish processing a SunTimes object.
+        """
+        date_adjusted_sun_times_object = self.date_adjustment.adjust_dates(sun_times)
 
         processed_sun_times_object = self.midday_calculator.process_midday_period(
             date_adjusted_sun_times_object
         )
 
         return processed_sun_times_object
+
+    def process_response(self, response: Dict[str, str]) -> SunTimes:
+        """
+        Processes the sun times data of one API response into a SunTimes object.
+
+        Args:
+            response (Dict[str, str]): The "results" object of the API response.
+
+        Returns:
+            SunTimes: A structured object containing the processed sun times data.
+
+        Process:
+            1. Validates and parses the API response using `format_response`.
+            2. Processes the parsed sun times using `process_sun_times`.
+            3. Adjusts the dates and calculates the midday period using `adjust_sun_times`.
+
+        Single Responsibility: Process one API response into a SunTimes object.
+        """
+        formatted_response = self.format_response(response)
+        raw_sun_times_object = process_sun_times(formatted_response)
+        return self.adjust_sun_times(raw_sun_times_object)
+
+    def process_api_call(self) -> SunTimes:
+        """
+        Processes an API call to fetch and process sun times data.
+
+        Returns:
+            SunTimes: A structured object containing the processed sun times data.
+
+        Process:
+            1. Fetches sun times data for the requested location using `SunTimesAPI`.
+            2. Processes the API response using `process_response`.
+
+        Single Responsibility: Manage the entire process of fetching and processing sun times data.
+        """
+
+        response = SunTimesAPI.fetch_sun_times()
+        return self.process_response(response)
+
+    def process_api_call_batch(
+        self, coordinates: List[Tuple[float, float]]
+    ) -> List[SunTimes]:
+        """
+        Processes API calls to fetch and process sun times data for many locations.
+
+        Args:
+            coordinates (List[Tuple[float, float]]): The (latitude, longitude) pairs to process.
+
+        Returns:
+            List[SunTimes]: The processed sun times data for each location, in the same order as
+            the input.
+
+        Process:
+            1. Fetches sun times data for every location using `SunTimesAPI`.
+            2. Validates and parses each API response using `format_response`.
+            3. Processes all parsed sun times with one user time using `process_sun_times_batch`.
+            4. Adjusts the dates and calculates the midday period of each using `adjust_sun_times`.
+
+        Single Responsibility: Manage fetching and processing sun times data for a batch of
+        locations.
+        """
+        responses = SunTimesAPI.fetch_sun_times_batch(coordinates)
+        formatted_responses = [self.format_response(response) for response in responses]
+        return [
+            self.adjust_sun_times(sun_times)
+            for sun_times in process_sun_times_batch(formatted_responses)
+        ]
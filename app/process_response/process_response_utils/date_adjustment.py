@@ -18,13 +18,12 @@ Usage:
 
 Dependencies:
     - abc: Provides the abstract base class functionality.
-    - datetime: Used for handling date and time calculations.
-    - app.sun_times: Contains the `SunTimes` class used to structure the date-adjusted time data.
+    - app.sun_times: Contains the `SunTimes` class used to structure the date-adjusted time data,
+      and the `ONE_DAY` constant used to shift dates by a day.
 """
 
-from datetime import time, timedelta
 from abc import ABC, abstractmethod
-from app.sun_times import SunTimes
+from app.sun_times import ONE_DAY, SunTimes
 
 
 class AbstractDateAdjustment(ABC):
@@ -125,11 +124,11 @@ class DateAdjustment(AbstractDateAdjustment):
         """
         See base class `AbstractDateAdjustment` for full method documentation.
         """
-        if time(00, 00) <= sun_times.user_time.time() < sun_times.sunrise.time():
-            sun_times.user_time += timedelta(days=1)
-        sun_times.sunrise += timedelta(days=1)
-        sun_times.sunset += timedelta(days=1)
-        sun_times.night_twilight += timedelta(days=1)
+        if sun_times.user_time.time() < sun_times.sunrise.time():
+            sun_times.user_time += ONE_DAY
+        sun_times.sunrise += ONE_DAY
+        sun_times.sunset += ONE_DAY
+        sun_times.night_twilight += ONE_DAY
 
         return sun_times
 
@@ -137,10 +136,10 @@ class DateAdjustment(AbstractDateAdjustment):
         """
         See base class `AbstractDateAdjustment` for full method documentation.
         """
-        if time(00, 00) <= sun_times.user_time.time() < sun_times.night_twilight.time():
-            sun_times.user_time += timedelta(days=1)
-        sun_times.sunset += timedelta(days=1)
-        sun_times.night_twilight += timedelta(days=1)
+        if sun_times.user_time.time() < sun_times.night_twilight.time():
+            sun_times.user_time += ONE_DAY
+        sun_times.sunset += ONE_DAY
+        sun_times.night_twilight += ONE_DAY
 
         return sun_times
 
@@ -148,8 +147,8 @@ class DateAdjustment(AbstractDateAdjustment):
         """
         See base class `AbstractDateAdjustment` for full method documentation.
         """
-        if time(00, 00) <= sun_times.user_time.time() < sun_times.night_twilight.time():
-            sun_times.user_time += timedelta(days=1)
-        sun_times.night_twilight += timedelta(days=1)
+        if sun_times.user_time.time() < sun_times.night_twilight.time():
+            sun_times.user_time += ONE_DAY
+        sun_times.night_twilight += ONE_DAY
 
         return sun_times
@@ -19,13 +19,12 @@ Usage:
 
 Dependencies:
     - abc: Provides the abstract base class functionality.
-    - datetime: Used for handling date and time calculations.
-    - app.sun_times: Contains the `SunTimes` class used to structure the midday period data.
+    - app.sun_times: Contains the `SunTimes` class used to structure the midday period data,
+      and the `ONE_DAY` constant used to shift dates by a day.
 """
 
-from datetime import timedelta
 from abc import ABC, abstractmethod
-from app.sun_times import SunTimes
+from app.sun_times import ONE_DAY, SunTimes
 
 
 class AbstractMiddayPeriodCalculator(ABC):
@@ -121,9 +120,9 @@ class MiddayPeriodCalculator(AbstractMiddayPeriodCalculator):
             sun_times.midday_period_begins < sun_times.sunrise
             or sun_times.midday_period_begins < sun_times.morning_twilight
         ):
-            sun_times.midday_period_begins += timedelta(days=1)
+            sun_times.midday_period_begins += ONE_DAY
 
         if sun_times.midday_period_ends < sun_times.midday_period_begins:
-            sun_times.midday_period_ends += timedelta(days=1)
+            sun_times.midday_period_ends += ONE_DAY
 
         return sun_times
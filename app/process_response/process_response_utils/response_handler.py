@@ -20,16 +20,22 @@ Dependencies:
     - abc: Provides the abstract base class functionality.
     - datetime: Used for parsing and handling date and time data.
     - typing: Provides type hinting for better code readability and maintenance.
-    - requests: Used for handling HTTP requests and responses.
     - app.sun_times: Contains the `SunTimes` class used to structure the parsed time data.
 """
 
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Dict
-import requests
+from datetime import datetime, time
+from typing import Dict, Final, Tuple
 from app.sun_times import SunTimes
 
+# Keys of the API response holding the sun times this service uses.
+API_TIME_KEYS: Final[Tuple[str, ...]] = (
+    "sunrise",
+    "sunset",
+    "civil_twilight_begin",
+    "civil_twilight_end",
+)
+
 
 class AbstractResponseHandler(ABC):
     """
@@ -44,15 +50,12 @@ class AbstractResponseHandler(ABC):
     """
 
     @abstractmethod
-    def extract_times_from_api_response(
-        self, raw_api_response: requests.models.Response
-    ) -> Dict[str, str]:
+    def extract_times_from_api_response(self, raw_api_response: dict) -> Dict[str, str]:
         """
         Extracts time-related data from the raw API response.
 
         Args:
-            raw_api_response (requests.models.Response): The raw HTTP response from the sunrise
-            -sunset API.
+            raw_api_response (dict): The "results" object of the sunrise-sunset API response.
 
         Returns:
             Dict[str, str]: A dictionary containing time data as strings.
@@ -75,12 +78,12 @@ class AbstractResponseHandler(ABC):
         Single Responsibility: Parsing a strings dictionary into a SunTimes object.
         """
 
-    def handle_response(self, raw_api_response: requests.models.Response) -> SunTimes:
+    def handle_response(self, raw_api_response: dict) -> SunTimes:
         """
         Handles the API response, converting it into a usable SunTimes object.
 
         Args:
-            raw_api_response (requests.models.Response): The raw HTTP response from the API.
+            raw_api_response (dict): The "results" object of the API response.
 
         Returns:
             SunTimes: A structured object containing the valid parsed sunrise, sunset, twilight
@@ -105,13 +108,11 @@ class ResponseHandler(AbstractResponseHandler):
     This class implements the methods to extract and parse time data from the API response.
     """
 
-    def extract_times_from_api_response(
-        self, raw_api_response: requests.models.Response
-    ) -> Dict[str, str]:
+    def extract_times_from_api_response(self, raw_api_response: dict) -> Dict[str, str]:
         """
         See base class `AbstractResponseHandler` for full method documentation.
         """
-        return raw_api_response.json()["results"]
+        return {key: raw_api_response[key] for key in API_TIME_KEYS}
 
     def parse_sun_times(
         self, times_as_strings: Dict[str, str]
@@ -120,16 +121,36 @@ class ResponseHandler(AbstractResponseHandler):
         See base class `AbstractResponseHandler` for full method documentation.
         """
         return {
-            "sunrise": datetime.strptime(
-                times_as_strings["sunrise"], "%I:%M:%S %p"
-            ).time(),
-            "sunset": datetime.strptime(
-                times_as_strings["sunset"], "%I:%M:%S %p"
-            ).time(),
-            "morning_twilight": datetime.strptime(
-                times_as_strings["civil_twilight_begin"], "%I:%M:%S %p"
-            ).time(),
-            "night_twilight": datetime.strptime(
-                times_as_strings["civil_twilight_end"], "%I:%M:%S %p"
-            ).time(),
+            "sunrise": self.parse_time(times_as_strings["sunrise"]),
+            "sunset": self.parse_time(times_as_strings["sunset"]),
+            "morning_twilight": self.parse_time(
+                times_as_strings["civil_twilight_begin"]
+            ),
+            "night_twilight": self.parse_time(times_as_strings["civil_twilight_end"]),
         }
+
+    @staticmethod
+    def parse_time(time_string: str) -> time:
+        """
+        Parses a 12-hour API time string such as "7:27:02 PM" into a time object.
+
+        The API's fixed "H:MM:SS AM" shape is parsed directly, which is much faster than
+        `strptime`; anything else falls back to `strptime`, which raises a `ValueError` describing
+        the malformed time.
+
+        Args:
+            time_string (str): The time string from the API response.
+
+        Returns:
+            time: The parsed time.
+
+        Single Responsibility: Parse a single API time string.
+        """
+        try:
+            clock, meridiem = time_string.split(" ")
+            hour, minute, second = (int(part) for part in clock.split(":"))
+            if 1 <= hour <= 12 and meridiem in ("AM", "PM"):
+                return time(hour % 12 + (12 if meridiem == "PM" else 0), minute, second)
+        except ValueError:
+            pass
+        return datetime.strptime(time_string, "%I:%M:%S %p").time()
@@ -9,19 +9,64 @@ Classes:
 
 Usage:
     The `SunTimesAPI` class provides a static method to make an API call and retrieve sun times 
-    data.
+    data. Responses are cached per location and UTC day.
 
 Example:
     response = SunTimesAPI.fetch_sun_times(lat, lng)
 
 Dependencies:
+    - concurrent.futures: Used for sharing one in-flight API call between concurrent requests, and
+      for fetching the locations of a batch concurrently.
+    - collections: Used for caching API responses per location and day, least recently used first.
+    - threading: Used for guarding the response cache and the in-flight API calls shared between
+      request threads.
+    - time: Used for determining the current UTC day.
+    - typing: Provides type hinting for better code readability and maintenance.
     - requests: Used for handling HTTP requests and responses.
+    - urllib3: Used for configuring retries of failed API calls.
     - flask: Used for accessing the current application configuration.
 """
 
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import current_app, request, jsonify, abort
 
+# Shared session so connections to the sunrise-sunset API are kept alive and reused across calls.
+# The pool holds enough connections for concurrent request threads, so they are not discarded after
+# each call. Transient upstream failures are retried with exponential backoff; once retries run
+# out, the last response is returned so raise_for_status raises an HTTPError for every status.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False,
+)
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=_RETRY),
+)
+
+# The UTC day the response cache was last used on, so entries from earlier days can be evicted
+_CACHED_DAY: List[int] = [0]
+
+# API results per (quantized lat, quantized lng, UTC day), least recently used first
+_RESPONSE_CACHE: "OrderedDict[Tuple[float, float, int], Dict[str, str]]" = OrderedDict()
+_MAX_CACHED_RESPONSES = 1024
+
+# API calls currently in flight, keyed like the response cache, so concurrent cache misses for the
+# same location and day wait on one call instead of each calling the API. The lock guards both the
+# in-flight calls and the response cache, so a call is always cached before it is retired.
+_INFLIGHT: Dict[Tuple[float, float, int], Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
 
 class SunTimesAPI:
     """
@@ -47,8 +92,58 @@ class SunTimesAPI:
         """
         lat = request.args.get("lat", type=float)
         lng = request.args.get("lng", type=float)
+        SunTimesAPI.validate_coordinates(lat, lng)
+
+        return lat, lng
 
-        # Validate latitude and longitude
+    @staticmethod
+    def get_batch_args() -> List[Tuple[float, float]]:
+        """
+        Gets the list of coordinates from the JSON body of a batch request, aborting the request
+        with a 400 response if the body is malformed or has too many points.
+
+        The body has the form {"points": [{"lat": ..., "lng": ...}, ...]}, where each coordinate
+        must be a JSON number. The coordinates are range-checked later by `fetch_sun_times_batch`.
+
+        Returns:
+            List[Tuple[float, float]]: The (latitude, longitude) pairs, in request order.
+
+        Single Responsibility: Get the user's provided batch of latitudes and longitudes
+        """
+        body = request.get_json(silent=True)
+        points = body.get("points") if isinstance(body, dict) else None
+        if not isinstance(points, list) or not points:
+            abort(400, description="A non-empty list of points is required.")
+
+        max_points = current_app.config["BATCH_MAX_POINTS"]
+        if len(points) > max_points:
+            abort(400, description=f"At most {max_points} points can be requested.")
+
+        coordinates = []
+        for point in points:
+            lat = point.get("lat") if isinstance(point, dict) else None
+            lng = point.get("lng") if isinstance(point, dict) else None
+            # JSON booleans decode to bool, which is an int subclass, so exclude it explicitly
+            if not all(
+                isinstance(value, (int, float)) and not isinstance(value, bool)
+                for value in (lat, lng)
+            ):
+                abort(400, description="Each point requires a numeric lat and lng.")
+            coordinates.append((float(lat), float(lng)))
+
+        return coordinates
+
+    @staticmethod
+    def validate_coordinates(lat: Optional[float], lng: Optional[float]) -> None:
+        """
+        Validates a latitude and longitude, aborting the request with a 400 response if invalid.
+
+        Args:
+            lat (Optional[float]): The latitude to validate.
+            lng (Optional[float]): The longitude to validate.
+
+        Single Responsibility: Validate the user's provided latitude and longitude
+        """
         if lat is None or lng is None:
             abort(400, description="Latitude and longitude are required.")
 
@@ -58,8 +153,6 @@ class SunTimesAPI:
         if not (-180 <= lng <= 180):
             abort(400, description="Longitude must be between -180 and 180.")
 
-        return lat, lng
-
     @staticmethod
     def construct_api_url(lat: float, lng: float) -> str:
         """
@@ -77,16 +170,168 @@ class SunTimesAPI:
         return f"{current_app.config['SUNRISE_SUNSET_API_BASE_URL']}lat={lat}&lng={lng}"
 
     @staticmethod
-    def fetch_sun_times() -> requests.models.Response:
+    def current_day() -> int:
+        """
+        Returns the current UTC day, clearing the response cache the first time a new day is seen.
+
+        Cached responses are keyed by day, so once the day changes the older entries can never be
+        hit again; evicting them lazily keeps them from filling the cache until they are the least
+        recently used.
+
+        Returns:
+            int: The current UTC day as days since the epoch.
+
+        Single Responsibility: Determine the UTC day used to key cached API responses.
+        """
+        day = int(time.time()) // 86400
+        if day != _CACHED_DAY[0]:
+            SunTimesAPI.clear_cache()
+            _CACHED_DAY[0] = day
+        return day
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Clears every cached API response.
+
+        Single Responsibility: Empty the response cache.
+        """
+        with _INFLIGHT_LOCK:
+            _RESPONSE_CACHE.clear()
+
+    @staticmethod
+    def call_api(lat: float, lng: float) -> Dict[str, str]:
+        """
+        Calls the external API for sun times data through the shared, pooled session.
+
+        Args:
+            lat (float): The latitude for the API call.
+            lng (float): The longitude for the API call.
+
+        Returns:
+            Dict[str, str]: The "results" object of the API response, mapping sun phases to times.
+
+        Raises:
+            requests.HTTPError: If the API responds with an error status, including server errors
+            that are still failing after the retries.
+
+        Single Responsibility: Make an API call to fetch sun times data.
+        """
+        url = SunTimesAPI.construct_api_url(lat, lng)
+        response = _SESSION.get(
+            url, timeout=current_app.config["SUNRISE_SUNSET_API_TIMEOUT"]
+        )
+        # Raise on error statuses so failed responses are never cached
+        response.raise_for_status()
+        return response.json()["results"]
+
+    @staticmethod
+    def request_sun_times(lat: float, lng: float, day: int) -> Dict[str, str]:
         """
-        Fetches sun times data from an external API based on latitude and longitude.
+        Requests sun times data from the external API, caching the parsed results per coordinate
+        and UTC day.
+
+        Concurrent cache misses for the same coordinate and day share a single API call: the first
+        caller makes it, and the others wait for its result or error. The result is cached before
+        the call is retired, so a caller arriving in between finds it in the cache.
+
+        Args:
+            lat (float): The quantized latitude for the API call.
+            lng (float): The quantized longitude for the API call.
+            day (int): The UTC day (days since the epoch) the data is requested for; only used as
+            part of the cache key.
 
         Returns:
-            requests.models.Response: The raw HTTP response from the API.
+            Dict[str, str]: The "results" object of the API response, mapping sun phases to times.
+
+        Raises:
+            requests.HTTPError: If the API responds with an error status, including server errors
+            that are still failing after the retries.
+
+        Single Responsibility: Make an API call to fetch sun times data, once per location per day.
+        """
+        key = (lat, lng, day)
+        with _INFLIGHT_LOCK:
+            if key in _RESPONSE_CACHE:
+                _RESPONSE_CACHE.move_to_end(key)
+                return _RESPONSE_CACHE[key]
+
+            future = _INFLIGHT.get(key)
+            is_caller = future is None
+            if is_caller:
+                future = _INFLIGHT[key] = Future()
+
+        if not is_caller:
+            return future.result()
+
+        try:
+            results = SunTimesAPI.call_api(lat, lng)
+        # BaseException too, so waiters are never left blocked on an unresolved call; failed
+        # calls are not cached
+        except BaseException as error:
+            with _INFLIGHT_LOCK:
+                del _INFLIGHT[key]
+            future.set_exception(error)
+            raise
+
+        with _INFLIGHT_LOCK:
+            _RESPONSE_CACHE[key] = results
+            if len(_RESPONSE_CACHE) > _MAX_CACHED_RESPONSES:
+                _RESPONSE_CACHE.popitem(last=False)
+            del _INFLIGHT[key]
+        future.set_result(results)
+        return results
+
+    @staticmethod
+    def fetch_sun_times() -> Dict[str, str]:
+        """
+        Fetches sun times data from an external API based on latitude and longitude, reusing pooled
+        connections from the shared session.
+
+        Coordinates are rounded to 3 decimal places (roughly 100m), which does not noticeably
+        change sun times, so nearby requests on the same UTC day share one cached API response.
+
+        Returns:
+            Dict[str, str]: The "results" object of the API response, mapping sun phases to times.
 
         Single Responsibility: Make an API call to fetch sun times data.
         """
         lat, lng = SunTimesAPI.get_args()
-        url = SunTimesAPI.construct_api_url(lat, lng)
-        response = requests.get(url, timeout=20)
-        return response
+        day = SunTimesAPI.current_day()
+        return SunTimesAPI.request_sun_times(round(lat, 3), round(lng, 3), day)
+
+    @staticmethod
+    def fetch_sun_times_batch(
+        coordinates: List[Tuple[float, float]]
+    ) -> List[Dict[str, str]]:
+        """
+        Fetches sun times data for many locations, validating each one first.
+
+        The sunrise-sunset API has no batch endpoint, so locations are fetched through the same
+        per-location, per-day cache as `fetch_sun_times`: duplicate or nearby coordinates in a
+        batch cost a single API call, and all calls share the pooled session. Locations missing
+        from the cache are fetched concurrently, each worker thread in its own application context.
+
+        Args:
+            coordinates (List[Tuple[float, float]]): The (latitude, longitude) pairs to fetch.
+
+        Returns:
+            List[Dict[str, str]]: The "results" object of the API response for each location, in
+            the same order as the input.
+
+        Single Responsibility: Fetch sun times data for a batch of locations.
+        """
+        for lat, lng in coordinates:
+            SunTimesAPI.validate_coordinates(lat, lng)
+
+        day = SunTimesAPI.current_day()
+        app = current_app._get_current_object()
+
+        def request_in_app_context(coordinate: Tuple[float, float]) -> Dict[str, str]:
+            with app.app_context():
+                lat, lng = coordinate
+                return SunTimesAPI.request_sun_times(round(lat, 3), round(lng, 3), day)
+
+        max_workers = min(app.config["BATCH_MAX_WORKERS"], len(coordinates)) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(request_in_app_context, coordinates))
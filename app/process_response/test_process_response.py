@@ -8,25 +8,124 @@ The tests verify the correct processing of the API response into a SunTimes obje
 edge cases
 
 Tests:
-    - test_no_adjustments: Tests the process_api_call method with no adjustments needed.
-    - test_sunrise_before_morning_twilight_adjustment: Tests the process_api_call method with 
-      sunrise before morning twilight.
-    - test_sunset_before_sunrise_adjustment: Tests the process_api_call method with sunset before 
-      sunrise.
-    - test_night_twilight_before_sunset_adjustment: Tests the process_api_call method with night 
-      twilight before sunset.
+    - test_process_api_call_<case>: Tests the process_api_call method, one generated test per
+      case, with no adjustments needed, sunrise before morning twilight, sunset before sunrise,
+      and night twilight before sunset.
+    - test_second_call_same_day_is_cached: Tests that the API is called once per location per day.
+    - test_new_day_evicts_cached_responses: Tests that responses from earlier days are evicted.
+    - test_concurrent_misses_share_one_call: Tests that concurrent cache misses share an API call.
+    - test_caller_after_retired_call_hits_cache: Tests that a caller arriving as the in-flight call
+      is retired finds the cached response.
+    - test_batch_fetch_sun_times: Tests that a batch of locations is fetched with one API call
+      per distinct location.
+    - test_process_api_call_batch: Tests that the sun times of every location in a batch are
+      processed.
+    - test_batch_route: Tests that the batch route returns one temperature per location, in order.
+    - test_uses_pooled_session: Tests that API calls go through the shared, pooled session.
+    - test_api_error_responses: Tests that error statuses from the API are raised.
+    - test_retried_server_errors_raise_http_error: Tests that server errors raise an HTTPError once
+      retries run out.
+    - test_parse_time_matches_strptime: Tests that API time strings are parsed like `strptime`.
+    - test_invalid_coordinates: Tests that invalid coordinates are rejected with a 400 response.
+    - test_invalid_batch_bodies: Tests that invalid batch bodies are rejected with a 400 response.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
 import unittest
-from datetime import datetime, timezone
-from unittest.mock import patch, MagicMock
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Callable, Dict
+from unittest.mock import call, patch, MagicMock
 import warnings
 from flask import Flask
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError
+from requests.models import Response
+from requests.sessions import Session
+from werkzeug.exceptions import BadRequest
 from freezegun import freeze_time
+from app.routes import register_routes
 from app.sun_times import SunTimes
 from .process_response import ProcessAPICall
+from app.process_response.process_response_utils import sun_times_api
+from app.process_response.process_response_utils.response_handler import ResponseHandler
+from app.process_response.process_response_utils.sun_times_api import SunTimesAPI
 
+SESSION_GET = "app.process_response.process_response_utils.sun_times_api._SESSION.get"
+UTC = timezone.utc
 
+
+def utc_datetime(day: int, hour: int, minute: int) -> datetime:
+    """
+    Build an aware UTC datetime in January 2024, the month all test responses are frozen in.
+    """
+    return datetime(2024, 1, day, hour, minute, tzinfo=UTC)
+
+
+# The user time every test runs at, matching the clock frozen in setUp
+FROZEN_USER_TIME = utc_datetime(1, 10, 0)
+
+
+# Results shared by every mocked API response; tests override the sun times they exercise.
+# Read-only so no test can leak changes into the others.
+MOCK_RESULTS = MappingProxyType(
+    {
+        "sunrise": "5:00:00 AM",
+        "sunset": "7:00:00 PM",
+        "solar_noon": "10:00:00 PM",
+        "day_length": "10:46:18",
+        "civil_twilight_begin": "4:30:00 AM",
+        "civil_twilight_end": "8:00:00 PM",
+        "nautical_twilight_begin": "5:55:00 PM",
+        "nautical_twilight_end": "2:58:54 AM",
+        "astronomical_twilight_begin": "6:24:17 PM",
+        "astronomical_twilight_end": "2:29:37 AM",
+    }
+)
+
+
+def make_process_api_call_test(
+    name: str, api_sun_times: Dict[str, str], expected_response: SunTimes
+) -> Callable:
+    """
+    Build a test method checking that process_api_call turns the given mocked API sun times into
+    the expected SunTimes.
+    """
+
+    def test(self):
+        with self.app.test_request_context("/night-time-temperature?lat=49&lng=-123"):
+            self.mock_get.return_value = self.mock_api_response(**api_sun_times)
+
+            process_api = ProcessAPICall()
+            response = process_api.process_api_call()
+
+        # SunTimes is a dataclass, so this compares every field at once
+        self.assertEqual(response, expected_response)
+
+    test.__doc__ = (
+        f"Test the process_api_call method for the {name.replace('_', ' ')} case."
+    )
+    return test
+
+
+def add_process_api_call_tests(test_case_class: type) -> type:
+    """
+    Class decorator adding one `test_process_api_call_<name>` method per entry in the class's
+    `CASES` table, so each case is individually named, selectable, and reported.
+    """
+    for name, api_sun_times, expected_response in test_case_class.CASES:
+        setattr(
+            test_case_class,
+            f"test_process_api_call_{name}",
+            make_process_api_call_test(name, api_sun_times, expected_response),
+        )
+    return test_case_class
+
+
+@add_process_api_call_tests
 class TestProcessAPICall(unittest.TestCase):
     """
     Unit tests for the process_api_call method.
@@ -36,309 +135,567 @@ class TestProcessAPICall(unittest.TestCase):
     sunrise before morning twilight, sunset before sunrise, and night twilight before sunset.
 
     Methods:
-        - setUp: Initializes the Flask application and pushes the application and request contexts.
-        - test_no_adjustments: Tests the process_api_call method with no adjustments needed.
-        - test_sunrise_before_morning_twilight_adjustment: Tests the process_api_call method with
-        sunrise before morning twilight.
-        - test_sunset_before_sunrise_adjustment: Tests the process_api_call method with sunset
-        before sunrise.
-        - test_night_twilight_before_sunset_adjustment: Tests the process_api_call method with night
-        twilight before sunset.
+        - setUpClass: Initializes the Flask application and the session mock once for all tests.
+        - tearDownClass: Stops the session mock.
+        - setUp: Pushes the application and request contexts and freezes the clock.
+        - mock_api_response: Builds a mock API response from the shared results.
+        - test_process_api_call_<case>: Generated from `CASES`; tests the process_api_call method
+        for one case.
+        - test_second_call_same_day_is_cached: Tests that the API is called once per location per
+        day.
+        - test_new_day_evicts_cached_responses: Tests that responses from earlier days are evicted.
+        - test_concurrent_misses_share_one_call: Tests that concurrent cache misses share an API
+        call.
+        - test_caller_after_retired_call_hits_cache: Tests that a caller arriving as the in-flight
+        call is retired finds the cached response.
+        - test_batch_fetch_sun_times: Tests that a batch of locations is fetched with one API call
+        per distinct location.
+        - test_process_api_call_batch: Tests that the sun times of every location in a batch are
+        processed.
+        - test_batch_route: Tests that the batch route returns one temperature per location, in
+        order.
+        - test_uses_pooled_session: Tests that API calls go through the shared, pooled session.
+        - test_api_error_responses: Tests that error statuses from the API are raised.
+        - test_retried_server_errors_raise_http_error: Tests that server errors raise an HTTPError
+        once retries run out.
+        - test_parse_time_matches_strptime: Tests that API time strings are parsed like
+        `strptime`.
+        - test_invalid_coordinates: Tests that invalid coordinates are rejected with a 400 response.
+        - test_invalid_batch_bodies: Tests that invalid batch bodies are rejected with a 400
+        response.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up the Flask application and push the application and request contexts. This method is
-        called before each test method.
-
+        Set up the Flask application once for the whole test case, since every test uses the same
+        configuration.
         """
         warnings.filterwarnings(
             "ignore",
             category=DeprecationWarning,
             message="The '__version__' attribute is deprecated and will be removed in Werkzeug 3.1.",
         )
-        self.app = Flask(__name__)
-        self.app.config.from_pyfile("../../config.py")
+        cls.app = Flask(__name__)
+        cls.app.config.from_pyfile("../../config.py")
+        register_routes(cls.app)
+        cls.client = cls.app.test_client()
+
+        # Mock the pooled session's get once for the whole test case
+        cls.session_get_patcher = patch(SESSION_GET)
+        cls.mock_get = cls.session_get_patcher.start()
 
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Stop the session mock started in setUpClass.
+        """
+        cls.session_get_patcher.stop()
+
+    def setUp(self):
+        """
+        Push the application and request contexts and freeze the clock. This method is called before
+        each test method.
+
+        """
         # Push the application context
         self.app_context = self.app.app_context()
         self.app_context.push()
+        self.addCleanup(self.app_context.pop)
 
         # Push the request context
         self.request_context = self.app.test_request_context()
         self.request_context.push()
+        self.addCleanup(self.request_context.pop)
 
-        self.client = self.app.test_client()
+        # Freeze the clock for every test, matching FROZEN_USER_TIME
+        freezer = freeze_time("2024-01-01 10:00:00", tz_offset=0)
+        self.frozen_time = freezer.start()
+        self.addCleanup(freezer.stop)
 
-    @freeze_time("2024-01-01 10:00:00", tz_offset=0)
-    @patch("requests.get")  # Mock requests.get
-    def test_no_adjustments(self, mock_get):
-        """
-        Test the process_api_call method with no adjustments needed.
+        # Tests mock different API responses for the same location and day
+        SunTimesAPI.clear_cache()
+        self.mock_get.reset_mock(return_value=True, side_effect=True)
 
-        This test verifies that the method correctly processes the API response when
-        no adjustments to the sunrise and sunset times are necessary.
+    @staticmethod
+    def mock_api_response(**sun_times) -> MagicMock:
+        """
+        Build a mock sunrise-sunset API response from the shared results, overriding the given sun
+        times.
 
         Args:
-            mock_get (MagicMock): Mock object for requests.get.
+            **sun_times (str): Time strings to set in the response results, keyed by API field name.
+
+        Returns:
+            MagicMock: A mock response whose JSON body holds the results.
+        """
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "results": {**MOCK_RESULTS, **sun_times},
+            "status": "OK",
+            "tzid": "UTC",
+        }
+        return mock_response
+
+    # Show the full SunTimes diff when a case fails
+    maxDiff = None
+
+    # (case name, sun times in the mocked API response, expected processed SunTimes)
+    CASES = (
+        (
+            "no_adjustments",
+            {
+                "sunrise": "5:00:00 AM",
+                "sunset": "7:00:00 PM",
+                "civil_twilight_begin": "4:30:00 AM",
+                "civil_twilight_end": "8:00:00 PM",
+            },
+            SunTimes(
+                sunrise=utc_datetime(1, 5, 0),
+                sunset=utc_datetime(1, 19, 0),
+                morning_twilight=utc_datetime(1, 4, 30),
+                night_twilight=utc_datetime(1, 20, 0),
+                midday_period_begins=utc_datetime(1, 5, 30),
+                midday_period_ends=utc_datetime(1, 18, 0),
+                user_time=FROZEN_USER_TIME,
+            ),
+        ),
+        (
+            "sunrise_before_morning_twilight",
+            {
+                "sunrise": "12:30:00 AM",
+                "sunset": "7:00:00 PM",
+                "civil_twilight_begin": "11:30:00 PM",
+                "civil_twilight_end": "8:00:00 PM",
+            },
+            SunTimes(
+                sunrise=utc_datetime(2, 0, 30),
+                sunset=utc_datetime(2, 19, 0),
+                morning_twilight=utc_datetime(1, 23, 30),
+                night_twilight=utc_datetime(2, 20, 0),
+                midday_period_begins=utc_datetime(2, 1, 30),
+                midday_period_ends=utc_datetime(2, 18, 0),
+                user_time=FROZEN_USER_TIME,
+            ),
+        ),
+        (
+            "sunset_before_sunrise",
+            {
+                "sunrise": "10:30:00 PM",
+                "sunset": "6:30:00 AM",
+                "civil_twilight_begin": "10:00:00 PM",
+                "civil_twilight_end": "7:30:00 AM",
+            },
+            SunTimes(
+                sunrise=utc_datetime(1, 22, 30),
+                sunset=utc_datetime(2, 6, 30),
+                morning_twilight=utc_datetime(1, 22, 0),
+                night_twilight=utc_datetime(2, 7, 30),
+                midday_period_begins=utc_datetime(1, 23, 0),
+                midday_period_ends=utc_datetime(2, 5, 30),
+                user_time=FROZEN_USER_TIME,
+            ),
+        ),
+        (
+            "night_twilight_before_sunset",
+            {
+                "sunrise": "4:30:00 PM",
+                "sunset": "11:30:00 PM",
+                "civil_twilight_begin": "3:30:00 PM",
+                "civil_twilight_end": "12:30:00 AM",
+            },
+            SunTimes(
+                sunrise=utc_datetime(1, 16, 30),
+                sunset=utc_datetime(1, 23, 30),
+                morning_twilight=utc_datetime(1, 15, 30),
+                night_twilight=utc_datetime(2, 0, 30),
+                midday_period_begins=utc_datetime(1, 17, 30),
+                midday_period_ends=utc_datetime(1, 22, 30),
+                user_time=FROZEN_USER_TIME,
+            ),
+        ),
+    )
+
+    # (lat, lng) query values that must be rejected before any API call is made
+    INVALID_COORDINATES = (
+        ("91", "0"),
+        ("-91", "0"),
+        ("0", "181"),
+        ("0", "-181"),
+        ("north", "0"),
+        ("", "0"),
+    )
+
+    # Batch request bodies that must be rejected with a 400 before any API call is made
+    INVALID_BATCH_BODIES = (
+        None,
+        {},
+        {"points": []},
+        {"points": [[49, -123]]},
+        {"points": [{"lat": 49}]},
+        {"points": [{"lat": "north", "lng": -123}]},
+        {"points": [{"lat": "49", "lng": "-123"}]},
+        {"points": [{"lat": True, "lng": -123}]},
+        {"points": [{"lat": 49, "lng": -123}] * 101},
+    )
+
+    def test_second_call_same_day_is_cached(self):
+        """
+        Test that repeated calls for the same location on the same UTC day reuse the cached API
+        response.
 
         Assertions:
-            - Verify that the processed SunTimes object matches the expected values.
+            - Verify that the API is called only once for the same and a nearby location.
         """
-        with self.app.test_request_context("/night-time-temperature?lat=49&lng=-123"):
-            # Create a mock response object
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "results": {
-                    "sunrise": "5:00:00 AM",
-                    "sunset": "7:00:00 PM",
-                    "solar_noon": "10:00:00 PM",
-                    "day_length": "10:46:18",
-                    "civil_twilight_begin": "4:30:00 AM",
-                    "civil_twilight_end": "8:00:00 PM",
-                    "nautical_twilight_begin": "5:55:00 PM",
-                    "nautical_twilight_end": "2:58:54 AM",
-                    "astronomical_twilight_begin": "6:24:17 PM",
-                    "astronomical_twilight_end": "2:29:37 AM",
-                },
-                "status": "OK",
-                "tzid": "UTC",
-            }
-
-            # Assign the mock response to requests.get
-            mock_get.return_value = mock_response
-
-            # Call process_api_call method
-            process_api = ProcessAPICall()
-            response = process_api.process_api_call()
+        self.mock_get.return_value = self.mock_api_response()
 
-            expected_response = SunTimes(
-                sunrise=datetime(2024, 1, 1, 5, 0, 0, tzinfo=timezone.utc),
-                sunset=datetime(2024, 1, 1, 19, 0, 0, tzinfo=timezone.utc),
-                morning_twilight=datetime(2024, 1, 1, 4, 30, 0, tzinfo=timezone.utc),
-                night_twilight=datetime(2024, 1, 1, 20, 0, 0, tzinfo=timezone.utc),
-                midday_period_begins=datetime(
-                    2024, 1, 1, 5, 30, 0, tzinfo=timezone.utc
-                ),
-                midday_period_ends=datetime(2024, 1, 1, 18, 0, 0, tzinfo=timezone.utc),
-                user_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc),
-            )
-            # Assertions
-            self.assertEqual(response.sunrise, expected_response.sunrise)
-            self.assertEqual(response.sunset, expected_response.sunset)
-            self.assertEqual(
-                response.morning_twilight, expected_response.morning_twilight
-            )
-            self.assertEqual(response.night_twilight, expected_response.night_twilight)
-            self.assertEqual(
-                response.midday_period_begins, expected_response.midday_period_begins
-            )
-            self.assertEqual(
-                response.midday_period_ends, expected_response.midday_period_ends
-            )
-            self.assertEqual(response.user_time, expected_response.user_time)
-
-    @freeze_time("2024-01-01 10:00:00", tz_offset=0)
-    @patch("requests.get")  # Mock requests.get
-    def test_sunrise_before_morning_twilight_adjustment(self, mock_get):
-        """
-        Test the process_api_call method with sunrise before morning twilight.
-
-        This test verifies that the method correctly processes the API response when
-        the sunrise time is before the morning twilight time.
+        for query in (
+            "lat=49&lng=-123",
+            "lat=49&lng=-123",
+            "lat=49.0001&lng=-123.0001",
+        ):
+            with self.app.test_request_context(f"/night-time-temperature?{query}"):
+                ProcessAPICall().process_api_call()
 
-        Args:
-            mock_get (MagicMock): Mock object for requests.get.
+        self.assertEqual(self.mock_get.call_count, 1)
+
+    def test_new_day_evicts_cached_responses(self):
+        """
+        Test that cached API responses from an earlier UTC day are evicted once the day changes.
 
         Assertions:
-            - Verify that the processed SunTimes object matches the expected values.
+            - Verify that the API is called again on the next day.
+            - Verify that only the current day's response remains cached.
         """
+        self.mock_get.return_value = self.mock_api_response()
+
         with self.app.test_request_context("/night-time-temperature?lat=49&lng=-123"):
-            # Create a mock response object
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "results": {
-                    "sunrise": "12:30:00 AM",
-                    "sunset": "7:00:00 PM",
-                    "solar_noon": "10:00:00 PM",
-                    "day_length": "10:46:18",
-                    "civil_twilight_begin": "11:30:00 PM",
-                    "civil_twilight_end": "8:00:00 PM",
-                    "nautical_twilight_begin": "5:55:00 PM",
-                    "nautical_twilight_end": "2:58:54 AM",
-                    "astronomical_twilight_begin": "6:24:17 PM",
-                    "astronomical_twilight_end": "2:29:37 AM",
-                },
-                "status": "OK",
-                "tzid": "UTC",
-            }
-
-            # Assign the mock response to requests.get
-            mock_get.return_value = mock_response
+            SunTimesAPI.fetch_sun_times()
+            self.frozen_time.tick(timedelta(days=1))
+            SunTimesAPI.fetch_sun_times()
 
-            process_api = ProcessAPICall()
-            # Call your function that processes the API response
-            response = process_api.process_api_call()
-            expected_response = SunTimes(
-                sunrise=datetime(2024, 1, 2, 0, 30, 0, tzinfo=timezone.utc),
-                sunset=datetime(2024, 1, 2, 19, 0, 0, tzinfo=timezone.utc),
-                morning_twilight=datetime(2024, 1, 1, 23, 30, 0, tzinfo=timezone.utc),
-                night_twilight=datetime(2024, 1, 2, 20, 00, 0, tzinfo=timezone.utc),
-                midday_period_begins=datetime(
-                    2024, 1, 2, 1, 30, 0, tzinfo=timezone.utc
-                ),
-                midday_period_ends=datetime(2024, 1, 2, 18, 0, 0, tzinfo=timezone.utc),
-                user_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc),
-            )
-            # Assertions
-            self.assertEqual(response.sunrise, expected_response.sunrise)
-            self.assertEqual(response.sunset, expected_response.sunset)
-            self.assertEqual(
-                response.morning_twilight, expected_response.morning_twilight
-            )
-            self.assertEqual(response.night_twilight, expected_response.night_twilight)
-            self.assertEqual(
-                response.midday_period_begins, expected_response.midday_period_begins
-            )
-            self.assertEqual(
-                response.midday_period_ends, expected_response.midday_period_ends
-            )
-            self.assertEqual(response.user_time, expected_response.user_time)
-
-    @freeze_time("2024-01-01 10:00:00", tz_offset=0)
-    @patch("requests.get")  # Mock requests.get
-    def test_sunset_before_sunrise_adjustment(self, mock_get):
-        """
-        Test the process_api_call method with sunset before sunrise.
-
-        This test verifies that the method correctly processes the API response when
-        the sunset time is before the sunrise time.
+        self.assertEqual(self.mock_get.call_count, 2)
+        self.assertEqual(len(sun_times_api._RESPONSE_CACHE), 1)
 
-        Args:
-            mock_get (MagicMock): Mock object for requests.get.
+    def test_concurrent_misses_share_one_call(self):
+        """
+        Test that concurrent cache misses for the same location and day wait on a single API call.
 
         Assertions:
-            - Verify that the processed SunTimes object matches the expected values.
+            - Verify that every caller gets the API response.
+            - Verify that the API is called only once.
         """
-        with self.app.test_request_context("/night-time-temperature?lat=49&lng=-123"):
-            # Create a mock response object
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "results": {
-                    "sunrise": "10:30:00 PM",
-                    "sunset": "6:30:00 AM",
-                    "solar_noon": "10:00:00 PM",
-                    "day_length": "10:46:18",
-                    "civil_twilight_begin": "10:00:00 PM",
-                    "civil_twilight_end": "7:30:00 AM",
-                    "nautical_twilight_begin": "5:55:00 PM",
-                    "nautical_twilight_end": "2:58:54 AM",
-                    "astronomical_twilight_begin": "6:24:17 PM",
-                    "astronomical_twilight_end": "2:29:37 AM",
-                },
-                "status": "OK",
-                "tzid": "UTC",
-            }
-
-            # Assign the mock response to requests.get
-            mock_get.return_value = mock_response
+        api_called = threading.Event()
+        release_api = threading.Event()
 
-            process_api = ProcessAPICall()
-            # Call your function that processes the API response
-            response = process_api.process_api_call()
-            expected_response = SunTimes(
-                sunrise=datetime(2024, 1, 1, 22, 30, 0, tzinfo=timezone.utc),
-                sunset=datetime(2024, 1, 2, 6, 30, 0, tzinfo=timezone.utc),
-                morning_twilight=datetime(2024, 1, 1, 22, 0, 0, tzinfo=timezone.utc),
-                night_twilight=datetime(2024, 1, 2, 7, 30, 0, tzinfo=timezone.utc),
-                midday_period_begins=datetime(
-                    2024, 1, 1, 23, 0, 0, tzinfo=timezone.utc
-                ),
-                midday_period_ends=datetime(2024, 1, 2, 5, 30, 0, tzinfo=timezone.utc),
-                user_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc),
-            )
-            # Assertions
-            self.assertEqual(response.sunrise, expected_response.sunrise)
-            self.assertEqual(response.sunset, expected_response.sunset)
-            self.assertEqual(
-                response.morning_twilight, expected_response.morning_twilight
-            )
-            self.assertEqual(response.night_twilight, expected_response.night_twilight)
-            self.assertEqual(
-                response.midday_period_begins, expected_response.midday_period_begins
-            )
-            self.assertEqual(
-                response.midday_period_ends, expected_response.midday_period_ends
-            )
-            self.assertEqual(response.user_time, expected_response.user_time)
-
-    @freeze_time("2024-01-01 10:00:00", tz_offset=0)
-    @patch("requests.get")  # Mock requests.get
-    def test_night_twilight_before_sunset_adjustment(self, mock_get):
-        """
-        Test the process_api_call method with night twilight before sunset.
-
-        This test verifies that the method correctly processes the API response when
-        the night twilight time is before the sunset time.
+        def slow_get(*args, **kwargs):
+            api_called.set()
+            release_api.wait(timeout=5)
+            return self.mock_api_response()
 
-        Args:
-            mock_get (MagicMock): Mock object for requests.get.
+        def request_sun_times():
+            with self.app.app_context():
+                return SunTimesAPI.request_sun_times(49.0, -123.0, 19723)
+
+        self.mock_get.side_effect = slow_get
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first = executor.submit(request_sun_times)
+            api_called.wait(timeout=5)
+            others = [executor.submit(request_sun_times) for _ in range(3)]
+            # Give the other callers time to start waiting on the in-flight call
+            time.sleep(0.1)
+            release_api.set()
+            results = [future.result() for future in [first, *others]]
+
+        self.assertEqual(results, [dict(MOCK_RESULTS)] * 4)
+        self.assertEqual(self.mock_get.call_count, 1)
+
+    def test_caller_after_retired_call_hits_cache(self):
+        """
+        Test that a caller arriving just after the in-flight call is retired finds the cached
+        response instead of calling the API again.
 
         Assertions:
-            - Verify that the processed SunTimes object matches the expected values.
+            - Verify that both callers get the API response.
+            - Verify that the API is called only once.
         """
-        with self.app.test_request_context("/night-time-temperature?lat=49&lng=-123"):
-            # Create a mock response object
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "results": {
-                    "sunrise": "4:30:00 PM",
-                    "sunset": "11:30:00 PM",
-                    "solar_noon": "10:00:00 PM",
-                    "day_length": "10:46:18",
-                    "civil_twilight_begin": "3:30:00 PM",
-                    "civil_twilight_end": "12:30:00 AM",
-                    "nautical_twilight_begin": "5:55:00 PM",
-                    "nautical_twilight_end": "2:58:54 AM",
-                    "astronomical_twilight_begin": "6:24:17 PM",
-                    "astronomical_twilight_end": "2:29:37 AM",
-                },
-                "status": "OK",
-                "tzid": "UTC",
-            }
-
-            # Assign the mock response to requests.get
-            mock_get.return_value = mock_response
+        retired = threading.Event()
+        resume = threading.Event()
+
+        class PausingInflight(dict):
+            """
+            In-flight map that pauses the first caller right after it retires its call.
+            """
+
+            def __delitem__(self, key):
+                super().__delitem__(key)
+                if not retired.is_set():
+                    retired.set()
+                    resume.wait(timeout=5)
+
+        def request_sun_times():
+            with self.app.app_context():
+                return SunTimesAPI.request_sun_times(49.0, -123.0, 19723)
+
+        self.mock_get.return_value = self.mock_api_response()
+
+        with patch.object(
+            sun_times_api, "_INFLIGHT", PausingInflight()
+        ), ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(request_sun_times)
+            retired.wait(timeout=5)
+            second = executor.submit(request_sun_times)
+            # Give the second caller time to look for the response while the first is paused
+            time.sleep(0.1)
+            resume.set()
+            results = [first.result(), second.result()]
+
+        self.assertEqual(results, [dict(MOCK_RESULTS)] * 2)
+        self.assertEqual(self.mock_get.call_count, 1)
+
+    def test_batch_fetch_sun_times(self):
+        """
+        Test that a batch of locations is fetched with one API call per distinct location.
 
-            process_api = ProcessAPICall()
-            # Call your function that processes the API response
-            response = process_api.process_api_call()
-            expected_response = SunTimes(
-                sunrise=datetime(2024, 1, 1, 16, 30, 0, tzinfo=timezone.utc),
-                sunset=datetime(2024, 1, 1, 23, 30, 0, tzinfo=timezone.utc),
-                morning_twilight=datetime(2024, 1, 1, 15, 30, 0, tzinfo=timezone.utc),
-                night_twilight=datetime(2024, 1, 2, 0, 30, 0, tzinfo=timezone.utc),
-                midday_period_begins=datetime(
-                    2024, 1, 1, 17, 30, 0, tzinfo=timezone.utc
+        Assertions:
+            - Verify that one result is returned per requested location.
+            - Verify that duplicate and nearby locations share a single API call, and that each
+              distinct location is requested once.
+        """
+        self.mock_get.return_value = self.mock_api_response()
+
+        results = SunTimesAPI.fetch_sun_times_batch(
+            [(49.0, -123.0), (49.0001, -123.0001), (49.0, -123.0), (35.6762, 139.6503)]
+        )
+
+        timeout = self.app.config["SUNRISE_SUNSET_API_TIMEOUT"]
+        self.assertEqual(len(results), 4)
+        # Locations are fetched concurrently, so the calls may arrive in any order
+        self.assertCountEqual(
+            self.mock_get.call_args_list,
+            [
+                call(
+                    "https://api.sunrise-sunset.org/json?lat=49.0&lng=-123.0",
+                    timeout=timeout,
                 ),
-                midday_period_ends=datetime(2024, 1, 1, 22, 30, 0, tzinfo=timezone.utc),
-                user_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc),
-            )
-            # Assertions
-            self.assertEqual(response.sunrise, expected_response.sunrise)
-            self.assertEqual(response.sunset, expected_response.sunset)
-            self.assertEqual(
-                response.morning_twilight, expected_response.morning_twilight
-            )
-            self.assertEqual(response.night_twilight, expected_response.night_twilight)
-            self.assertEqual(
-                response.midday_period_begins, expected_response.midday_period_begins
-            )
-            self.assertEqual(
-                response.midday_period_ends, expected_response.midday_period_ends
-            )
-            self.assertEqual(response.user_time, expected_response.user_time)
+                call(
+                    "https://api.sunrise-sunset.org/json?lat=35.676&lng=139.65",
+                    timeout=timeout,
+                ),
+            ],
+        )
+
+    def test_process_api_call_batch(self):
+        """
+        Test that process_api_call_batch processes the sun times of every location, in order.
+
+        Assertions:
+            - Verify that one SunTimes object is returned per requested location, each matching
+              the no adjustments case.
+            - Verify that every location shares the user time read once for the batch.
+        """
+        _, api_sun_times, expected_response = self.CASES[0]
+        self.mock_get.return_value = self.mock_api_response(**api_sun_times)
+
+        responses = ProcessAPICall().process_api_call_batch(
+            [(49.0, -123.0), (35.6762, 139.6503), (49.0, -123.0)]
+        )
+
+        self.assertEqual(responses, [expected_response] * 3)
+        self.assertIs(responses[1].user_time, responses[0].user_time)
+        self.assertIs(responses[2].user_time, responses[0].user_time)
+
+    def test_batch_route(self):
+        """
+        Test that the batch route returns one temperature per location, in request order, and
+        rejects invalid bodies.
+
+        Assertions:
+            - Verify that each location gets the temperature of its own sun times, in order.
+            - Verify that an empty list of points is rejected with a 400 response.
+        """
+        _, night_sun_times, _ = self.CASES[3]
+
+        def get_by_location(url, **kwargs):
+            if "lat=35.676" in url:
+                return self.mock_api_response(**night_sun_times)
+            return self.mock_api_response()
+
+        self.mock_get.side_effect = get_by_location
+
+        response = self.client.post(
+            "/night-time-temperature/batch",
+            json={
+                "points": [
+                    {"lat": 49.0, "lng": -123.0},
+                    {"lat": 35.6762, "lng": 139.6503},
+                    {"lat": 49.0, "lng": -123.0},
+                ]
+            },
+        )
+
+        hi_temp = self.app.config["HI_TEMP"]
+        lo_temp = self.app.config["LO_TEMP"]
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.get_json(),
+            [
+                {"temperature": hi_temp},
+                {"temperature": lo_temp},
+                {"temperature": hi_temp},
+            ],
+        )
+
+        response = self.client.post(
+            "/night-time-temperature/batch", json={"points": []}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_uses_pooled_session(self):
+        """
+        Test that API calls go through the shared, pooled session rather than `requests.get`.
+
+        Assertions:
+            - Verify that `requests.get` is never called and the shared session's get is called
+              once, with the expected URL and timeout.
+            - Verify that the session's HTTPS adapter retries failed calls.
+        """
+        self.mock_get.return_value = self.mock_api_response()
+
+        with patch("requests.get") as mock_requests_get, self.app.test_request_context(
+            "/night-time-temperature?lat=49&lng=-123"
+        ):
+            ProcessAPICall().process_api_call()
+
+        mock_requests_get.assert_not_called()
+        self.mock_get.assert_called_once_with(
+            "https://api.sunrise-sunset.org/json?lat=49.0&lng=-123.0",
+            timeout=self.app.config["SUNRISE_SUNSET_API_TIMEOUT"],
+        )
+
+        adapter = sun_times_api._SESSION.get_adapter(
+            self.app.config["SUNRISE_SUNSET_API_BASE_URL"]
+        )
+        self.assertIsInstance(adapter, HTTPAdapter)
+        self.assertEqual(adapter.max_retries.total, 3)
+
+    def test_api_error_responses(self):
+        """
+        Test that error statuses from the API are raised rather than processed or cached.
+
+        Assertions:
+            - Verify that each error status raises an HTTPError.
+        """
+        for status_code in (400, 404, 500):
+            with self.subTest(status=status_code), self.app.test_request_context(
+                "/night-time-temperature?lat=49&lng=-123"
+            ):
+                error_response = Response()
+                error_response.status_code = status_code
+                self.mock_get.return_value = error_response
+
+                with self.assertRaises(HTTPError):
+                    ProcessAPICall().process_api_call()
+
+    def test_retried_server_errors_raise_http_error(self):
+        """
+        Test that server errors still failing after the session's retries raise an HTTPError.
+
+        Assertions:
+            - Verify that the request is retried before giving up.
+            - Verify that an HTTPError, not a RetryError, is raised.
+        """
+        attempts = []
+
+        class ServerErrorHandler(BaseHTTPRequestHandler):
+            """
+            Answers every request with a 503, recording each attempt.
+            """
+
+            def do_GET(self):
+                attempts.append(self.path)
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), ServerErrorHandler)
+        # Poll often so shutting the server down at cleanup is quick
+        threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        ).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        # Send through the shared session's retrying adapter to the local server instead of the API
+        test_session = Session()
+        test_session.mount(
+            "http://",
+            sun_times_api._SESSION.get_adapter("https://api.sunrise-sunset.org"),
+        )
+        local_url = f"http://127.0.0.1:{server.server_port}/json"
+        self.mock_get.side_effect = lambda url, **kwargs: test_session.get(
+            local_url, **kwargs
+        )
+
+        # Skip the retry backoff delays
+        with patch("time.sleep"), self.app.test_request_context(
+            "/night-time-temperature?lat=49&lng=-123"
+        ), self.assertRaises(HTTPError):
+            ProcessAPICall().process_api_call()
+
+        self.assertEqual(len(attempts), 4)
+
+    def test_parse_time_matches_strptime(self):
+        """
+        Test that API time strings are parsed like `strptime` would, including around midnight and
+        noon, and that malformed times are still rejected.
+
+        Assertions:
+            - Verify that each valid time string is parsed to the same time as `strptime`.
+            - Verify that each malformed time string raises a ValueError.
+        """
+        for time_string in ("12:00:00 AM", "12:30:05 PM", "1:02:03 AM", "11:59:59 PM"):
+            with self.subTest(time_string=time_string):
+                self.assertEqual(
+                    ResponseHandler.parse_time(time_string),
+                    datetime.strptime(time_string, "%I:%M:%S %p").time(),
+                )
+
+        for time_string in ("13:00:00 PM", "0:00:00 AM", "7:60:00 AM", "7:00 AM", ""):
+            with self.subTest(time_string=time_string):
+                with self.assertRaises(ValueError):
+                    ResponseHandler.parse_time(time_string)
+
+    def test_invalid_coordinates(self):
+        """
+        Test that process_api_call rejects missing, non-numeric, and out-of-range coordinates.
+
+        Assertions:
+            - Verify that each invalid coordinate pair aborts with a 400 Bad Request.
+            - Verify that the API is never called.
+        """
+        for lat, lng in self.INVALID_COORDINATES:
+            with self.subTest(coords=(lat, lng)), self.app.test_request_context(
+                f"/night-time-temperature?lat={lat}&lng={lng}"
+            ), self.assertRaises(BadRequest):
+                ProcessAPICall().process_api_call()
+
+        self.mock_get.assert_not_called()
+
+    def test_invalid_batch_bodies(self):
+        """
+        Test that get_batch_args rejects missing, empty, malformed, and oversized batch bodies.
+
+        Assertions:
+            - Verify that each invalid body aborts with a 400 Bad Request.
+        """
+        for body in self.INVALID_BATCH_BODIES:
+            with self.subTest(body=body), self.app.test_request_context(
+                "/night-time-temperature/batch", method="POST", json=body
+            ), self.assertRaises(BadRequest):
+                SunTimesAPI.get_batch_args()
@@ -4,25 +4,26 @@ Module: routes
 This module provides the route registration function for the Flask application.
 
 Functions:
-    - register_routes: Registers the routes for the Flask application, including the route for 
-      fetching and processing sun times data to calculate the night-time temperature.
+    - register_routes: Registers the routes for the Flask application, including the routes for 
+      fetching and processing sun times data to calculate the night-time temperature of one or many
+      locations.
 
 Dependencies:
     - flask: Used for handling HTTP requests and responses.
-    - .main: Contains the `main` function for fetching, processing sun times data, and calculating 
-      temperature.
+    - .main: Contains the `main` and `main_batch` functions for fetching, processing sun times data,
+      and calculating temperature.
 """
 
 from flask import Response
-from .main import main
+from .main import main, main_batch
 
 
 def register_routes(app):
     """
     Registers the routes for the Flask application.
 
-    This function sets up the route for fetching and processing sun times data to calculate the
-    night-time temperature.
+    This function sets up the routes for fetching and processing sun times data to calculate the
+    night-time temperature of one location, or of a batch of locations.
 
     Args:
         app: The Flask application instance.
@@ -45,3 +46,21 @@ def register_routes(app):
         """
 
         return main()
+
+    @app.route("/night-time-temperature/batch", methods=["POST"])
+    def night_time_temperature_batch_route() -> Response:
+        """
+        Route for fetching and processing sun times data to calculate the night-time temperature of
+        many locations in one request.
+
+        This route handles POST requests and calls the `main_batch` function to fetch, process sun
+        times data, and calculate the temperature of each location.
+
+        Returns:
+            Response: A JSON list containing the calculated temperature of each location, in the
+            order the locations were requested.
+
+        Single Responsibility: Handle the POST request to calculate night-time temperatures in bulk.
+        """
+
+        return main_batch()
@@ -11,6 +11,12 @@ Classes:
       setting user time, combining sun times with a specific date, and representing sun times as a 
       string.
 
+Functions:
+    - process_sun_times: Processes a dictionary of sun times into a `SunTimes` object for the
+      user's current UTC day.
+    - process_sun_times_batch: Processes a list of sun times dictionaries into `SunTimes` objects,
+      reading the clock once for the whole batch.
+
 Usage:
     The `AbstractSunTimes` class should be subclassed to create custom sun time handlers that 
     implement the `set_user_time`, `combine_times_with_date`, and `__repr__` methods. The `SunTimes`
@@ -23,18 +29,50 @@ Example:
         "morning_twilight": datetime.time(5, 30),
         "night_twilight": datetime.time(18, 30),
     }
-    sun_times = AbstractSunTimes.process_sun_times(sun_times_dict)
+    sun_times = process_sun_times(sun_times_dict)
 
 Dependencies:
     - abc: Provides the abstract base class functionality.
     - datetime: Used for parsing and handling date and time data.
+    - functools: Used for caching sun phase times combined with a date.
     - typing: Provides type hinting for better code readability and maintenance.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 import datetime
+import functools
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
+from typing import ClassVar, Dict, Final, List, Optional, Tuple, Union
+
+# Sun phases hold a time of day until they are combined with a date into an aware datetime.
+SunPhaseTime = Union[datetime.time, datetime.datetime]
+
+_UTC: Final[datetime.timezone] = datetime.timezone.utc
+# Reused wherever sun times are shifted to the next day.
+ONE_DAY: Final[datetime.timedelta] = datetime.timedelta(days=1)
+
+
+@functools.lru_cache(maxsize=4096)
+def _combine_phases_with_date(
+    phases: Tuple[Optional[datetime.time], ...], date: datetime.date
+) -> Tuple[Optional[datetime.datetime], ...]:
+    """
+    Combines times of day with a date into aware UTC datetimes, caching the result.
+
+    Locations that share sun times on the same day reuse the same (immutable) datetimes, and the
+    date in the key keeps stale days from ever being returned.
+
+    Args:
+        phases (Tuple[Optional[datetime.time], ...]): The sun phase times, with None for unset ones.
+        date (datetime.date): The date to combine the times with.
+
+    Returns:
+        Tuple[Optional[datetime.datetime], ...]: The combined datetimes, in the same order.
+
+    Single Responsibility: Combine sun phase times with a date.
+    """
+    combine = datetime.datetime.combine
+    return tuple(combine(date, phase, _UTC) if phase else phase for phase in phases)
 
 
 class AbstractSunTimes(ABC):
@@ -50,29 +88,29 @@ class AbstractSunTimes(ABC):
     """
 
     @abstractmethod
-    def set_user_time(self):
+    def set_user_time(self) -> datetime.datetime:
         """
         Sets the user time, defaulting to the current UTC time.
 
         Returns:
-            sun_times.user_time: A SunTimes class attribute containing user_time.
+            datetime.datetime: The user time that was set on the object.
 
         Single Responsibility: Set the user time to the current UTC time.
         """
 
     @abstractmethod
-    def combine_times_with_date(self, date):
+    def combine_times_with_date(self, date: datetime.date) -> None:
         """
         Combines sun times with a given date, defaulting to today.
 
         Args:
-            sun_times_dict (Dict[str, datetime.time]): A dictionary containing sun times.
+            date (datetime.date): The date to combine the sun times with.
 
         Single Responsibility: Combine sun times with today's date.
         """
 
     @abstractmethod
-    def __repr__(self):
+    def __repr__(self) -> str:
         """
         Provides a string representation of the sun times.
 
@@ -80,29 +118,13 @@ class AbstractSunTimes(ABC):
         """
 
     @staticmethod
-    def process_sun_times(
-        sun_times_dict: Dict[str, datetime.datetime.time]
-    ) -> "SunTimes":
+    def process_sun_times(sun_times_dict: Dict[str, datetime.time]) -> "SunTimes":
         """
         Processes a dictionary of sun times into a SunTimes object.
 
-        Args:
-            sun_times_dict (Dict[str, datetime.time]): A dictionary containing sun times.
-
-        Returns:
-            SunTimes: An object representing the processed sun times.
-
-        Single Responsibility: Convert a dictionary of sun times into a SunTimes object.
+        See module-level `process_sun_times` for full method documentation.
         """
-        sun_times = SunTimes(
-            sunrise=sun_times_dict.get("sunrise"),
-            sunset=sun_times_dict.get("sunset"),
-            morning_twilight=sun_times_dict.get("morning_twilight"),
-            night_twilight=sun_times_dict.get("night_twilight"),
-        )
-        user_time = sun_times.set_user_time()
-        sun_times.combine_times_with_date(user_time.date())
-        return sun_times
+        return process_sun_times(sun_times_dict)
 
 
 @dataclass
@@ -111,68 +133,48 @@ class SunTimes(AbstractSunTimes):
     A concrete implementation of AbstractSunTimes for handling and processing sun times.
     """
 
-    sunrise: Optional[datetime.time] = None
-    sunset: Optional[datetime.time] = None
-    morning_twilight: Optional[datetime.time] = None
-    night_twilight: Optional[datetime.time] = None
-    midday_period_begins: Optional[datetime.time] = None
-    midday_period_ends: Optional[datetime.time] = None
-    user_time: Optional[datetime.datetime] = field(
-        default_factory=lambda: datetime.datetime.now(datetime.timezone.utc)
+    # Class-level template so __repr__ is a single %-format call; not a dataclass field.
+    _REPR_TEMPLATE: ClassVar[str] = (
+        "SunTimes(sunrise=%s, sunset=%s, morning_twilight=%s, night_twilight=%s, "
+        "midday_period_begins=%s, midday_period_ends=%s, user_time=%s)"
+    )
+
+    # Fields combined with a date by combine_times_with_date.
+    _SUN_PHASE_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "sunrise",
+        "sunset",
+        "morning_twilight",
+        "night_twilight",
+        "midday_period_begins",
+        "midday_period_ends",
     )
 
-    def set_user_time(self) -> None:
+    sunrise: Optional[SunPhaseTime] = None
+    sunset: Optional[SunPhaseTime] = None
+    morning_twilight: Optional[SunPhaseTime] = None
+    night_twilight: Optional[SunPhaseTime] = None
+    midday_period_begins: Optional[SunPhaseTime] = None
+    midday_period_ends: Optional[SunPhaseTime] = None
+    user_time: Optional[datetime.datetime] = None
+
+    def set_user_time(self) -> datetime.datetime:
         """
-        Sets the user time to the current UTC time if not already set.
+        Sets the user time to the current UTC time.
         """
-        self.user_time: datetime.datetime = datetime.datetime.now(
-            datetime.timezone.utc
-        ).replace(microsecond=0)
+        self.user_time = datetime.datetime.now(_UTC).replace(microsecond=0)
 
         return self.user_time
 
-    def combine_times_with_date(self, date) -> None:
+    def combine_times_with_date(self, date: datetime.date) -> None:
         """
         Combines sun times with the current date to create full datetime objects.
         """
-        self.sunrise: datetime.datetime = (
-            datetime.datetime.combine(date, self.sunrise, tzinfo=datetime.timezone.utc)
-            if self.sunrise
-            else None
-        )
-        self.sunset = (
-            datetime.datetime.combine(date, self.sunset, tzinfo=datetime.timezone.utc)
-            if self.sunset
-            else None
-        )
-        self.morning_twilight: datetime.datetime = (
-            datetime.datetime.combine(
-                date, self.morning_twilight, tzinfo=datetime.timezone.utc
-            )
-            if self.morning_twilight
-            else None
-        )
-        self.night_twilight: datetime.datetime = (
-            datetime.datetime.combine(
-                date, self.night_twilight, tzinfo=datetime.timezone.utc
-            )
-            if self.night_twilight
-            else None
-        )
-        self.midday_period_begins: datetime.datetime = (
-            datetime.datetime.combine(
-                date, self.midday_period_begins, tzinfo=datetime.timezone.utc
-            )
-            if self.midday_period_begins
-            else None
-        )
-        self.midday_period_ends: datetime.datetime = (
-            datetime.datetime.combine(
-                date, self.midday_period_ends, tzinfo=datetime.timezone.utc
-            )
-            if self.midday_period_ends
-            else None
+        phase_fields = self._SUN_PHASE_FIELDS
+        combined = _combine_phases_with_date(
+            tuple(getattr(self, name) for name in phase_fields), date
         )
+        for name, phase in zip(phase_fields, combined):
+            setattr(self, name, phase)
 
     def __repr__(self) -> str:
         """
@@ -181,10 +183,77 @@ class SunTimes(AbstractSunTimes):
         Returns:
             str: A string representation of the sun times.
         """
-        return (
-            f"SunTimes(sunrise={self.sunrise}, sunset={self.sunset}, "
-            f"morning_twilight={self.morning_twilight}, night_twilight={self.night_twilight}, "
-            f"midday_period_begins={self.midday_period_begins}, "
-            f"midday_period_ends={self.midday_period_ends}, "
-            f"user_time={self.user_time})"
+        return self._REPR_TEMPLATE % (
+            self.sunrise,
+            self.sunset,
+            self.morning_twilight,
+            self.night_twilight,
+            self.midday_period_begins,
+            self.midday_period_ends,
+            self.user_time,
         )
+
+
+def _build_sun_times(sun_times_dict: Dict[str, datetime.time]) -> SunTimes:
+    """
+    Builds a SunTimes object holding the sun phase times of a dictionary, without a date.
+
+    Args:
+        sun_times_dict (Dict[str, datetime.time]): A dictionary containing sun times.
+
+    Returns:
+        SunTimes: An object holding the sun times, not yet combined with a date.
+
+    Single Responsibility: Copy the sun times of a dictionary into a SunTimes object.
+    """
+    return SunTimes(
+        sunrise=sun_times_dict.get("sunrise"),
+        sunset=sun_times_dict.get("sunset"),
+        morning_twilight=sun_times_dict.get("morning_twilight"),
+        night_twilight=sun_times_dict.get("night_twilight"),
+    )
+
+
+def process_sun_times(sun_times_dict: Dict[str, datetime.time]) -> SunTimes:
+    """
+    Processes a dictionary of sun times into a SunTimes object.
+
+    Args:
+        sun_times_dict (Dict[str, datetime.time]): A dictionary containing sun times.
+
+    Returns:
+        SunTimes: An object representing the processed sun times.
+
+    Single Responsibility: Convert a dictionary of sun times into a SunTimes object.
+    """
+    sun_times = _build_sun_times(sun_times_dict)
+    sun_times.set_user_time()
+    sun_times.combine_times_with_date(sun_times.user_time.date())
+    return sun_times
+
+
+def process_sun_times_batch(
+    sun_times_dicts: List[Dict[str, datetime.time]]
+) -> List[SunTimes]:
+    """
+    Processes many dictionaries of sun times into SunTimes objects sharing one user time.
+
+    The clock is read once for the whole batch rather than once per entry.
+
+    Args:
+        sun_times_dicts (List[Dict[str, datetime.time]]): Dictionaries containing sun times.
+
+    Returns:
+        List[SunTimes]: The processed sun times, in the same order as the input.
+
+    Single Responsibility: Convert a batch of sun times dictionaries into SunTimes objects.
+    """
+    user_time = datetime.datetime.now(_UTC).replace(microsecond=0)
+    today = user_time.date()
+    batch = []
+    for sun_times_dict in sun_times_dicts:
+        sun_times = _build_sun_times(sun_times_dict)
+        sun_times.user_time = user_time
+        sun_times.combine_times_with_date(today)
+        batch.append(sun_times)
+    return batch
@@ -5,7 +5,16 @@ Constants:
 ----------
 SUNRISE_SUNSET_API_BASE_URL : str
     The base URL for the Sunrise-Sunset API used to fetch sun position data.
+
+SUNRISE_SUNSET_API_TIMEOUT : tuple
+    The (connect, read) timeouts in seconds for calls to the Sunrise-Sunset API.
     
+BATCH_MAX_POINTS : int
+    The maximum number of locations accepted by one batch temperature request.
+
+BATCH_MAX_WORKERS : int
+    The maximum number of threads fetching sun times concurrently for one batch request.
+
 LO_TEMP : int
     The lower temperature (in Kelvin) representing the screen brightness 
     during night-time.
@@ -21,6 +30,9 @@ PROFILE : str
 import os
 
 SUNRISE_SUNSET_API_BASE_URL = "https://api.sunrise-sunset.org/json?"
+SUNRISE_SUNSET_API_TIMEOUT = (2, 5)
+BATCH_MAX_POINTS = 100
+BATCH_MAX_WORKERS = 8
 LO_TEMP = 2700
 HI_TEMP = 6000
 PROFILE = os.getenv("PROFILE", "Pr")
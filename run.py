@@ -8,6 +8,9 @@ Usage:
     To run the development server:
         python run.py
 
+    To run the production server, as the Docker image does:
+        gunicorn --worker-class gthread --workers 2 --threads 32 --bind 0.0.0.0:8080 run:app
+
 Dependencies:
     - app module (containing the create_app factory method)
 """